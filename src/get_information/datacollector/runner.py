@@ -1,16 +1,27 @@
-import json
 import os
+import sqlite3
+import uuid
 from collections import defaultdict
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import fields
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Union, get_args, get_origin, get_type_hints
 
-from .schemas import BaseSchema
+import orjson
+import pyarrow as pa
+import pyarrow.dataset as ds
+import requests
+
+from .schemas import BaseSchema, NewsSchema, DisclosureSchema, ResearchSchema
 from .sources.kr_dart import DartCollector
 from .sources.us_edgar import EdgarCollector
 from .sources.news_collector import NewsCollector
 from .sources.research_collector import ResearchCollector
+from .utils.dates import parse_rfc2822
+from .utils.http import create_session
 
 # --- Approved News Sources ---
 KR_NEWS_SOURCES = [
@@ -25,62 +36,215 @@ US_NEWS_SOURCES = [
     "latimes.com", "chicagotribune.com", "forbes.com", "businessinsider.com", "marketwatch.com"
 ]
 
+# Index of item ids that have already been saved, kept in the data directory.
+# The leading underscore makes Parquet dataset discovery skip the file.
+SEEN_DB_NAME = "_seen.db"
+# Stay below SQLite's limit on the number of query parameters
+_SQLITE_MAX_PARAMS = 900
+
+# Zero-padded month/day strings, indexed by the number
+_TWO_DIGITS = tuple(f"{n:02d}" for n in range(32))
+
+# Field names per schema type; the schemas are flat, so a shallow getattr
+# pass is equivalent to asdict() without its recursive deep copy.
+_FIELD_NAMES = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (NewsSchema, DisclosureSchema, ResearchSchema)
+}
+
+# Arrow types of the schema field types; Optional[X] maps to a nullable X
+_ARROW_TYPES = {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()}
+# Partition columns added to every record written to the Parquet dataset
+_PARTITION_FIELDS = ("year", "month", "day", "country", "category")
+
 
-def save_data(data: List[BaseSchema], base_data_path: Path):
+def _field_names(schema_type: type) -> tuple:
+    """Returns the field names of a schema type, caching types not listed in _FIELD_NAMES."""
+    names = _FIELD_NAMES.get(schema_type)
+    if names is None:
+        names = _FIELD_NAMES[schema_type] = tuple(f.name for f in fields(schema_type))
+    return names
+
+
+@lru_cache(maxsize=4096)
+def _parse_pub_at(published_at: str) -> datetime:
     """
-    Saves a list of data schemas to JSON files, organized by year, month,
-    day, and category.
+    Parses a 'published_at' string (ISO-8601 or RFC-2822) into a datetime.
+    Cached by the raw string since items in a batch often share timestamps.
     """
+    if published_at.endswith('Z'):
+        return datetime.fromisoformat(published_at[:-1] + '+00:00')
+    try:
+        return datetime.fromisoformat(published_at)
+    except ValueError:
+        return parse_rfc2822(published_at)
+
+
+def save_data(data: List[BaseSchema], base_data_path: Path, file_format: str = "json"):
+    """
+    Saves a list of data schemas organized by year, month, day, country and
+    category. Items whose id has already been saved by an earlier run are
+    skipped, so overlapping collection windows do not duplicate records.
+
+    Args:
+        data (List[BaseSchema]): The data objects to save.
+        base_data_path (Path): The root directory of the saved data.
+        file_format (str): 'json' appends to one NDJSON file per country and
+                           category for each day; 'parquet' adds files to a
+                           Parquet dataset partitioned as
+                           year/month/day/country/category.
+    """
+    if file_format not in ("json", "parquet"):
+        raise ValueError(f"Unsupported file format: '{file_format}'")
     if not data:
         return
 
-    # Group data by date, country, and category for file organization
-    grouped_data: Dict[str, Dict[str, List]] = defaultdict(list)
+    base_data_path.mkdir(parents=True, exist_ok=True)
+    # closing() releases the connection; the inner `conn` block commits the transaction
+    with closing(sqlite3.connect(base_data_path / SEEN_DB_NAME)) as conn, conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY)")
+        seen_ids = _load_seen_ids(conn, [item.id for item in data])
+        skipped_count = len(seen_ids)
 
-    for item in data:
-        try:
-            # Handle multiple date formats to get a datetime object
-            if not item.published_at: continue
-
-            dt_obj = None
-            if "Z" in item.published_at:
-                dt_obj = datetime.fromisoformat(item.published_at.replace("Z", "+00:00"))
-            elif "GMT" in item.published_at:
-                 dt_obj = datetime.strptime(item.published_at, '%a, %d %b %Y %H:%M:%S %Z')
-            else: # Assume YYYY-MM-DD
-                dt_obj = datetime.fromisoformat(item.published_at)
-
-            # Define path and group key
-            year, month, day = str(dt_obj.year), f"{dt_obj.month:02d}", f"{dt_obj.day:02d}"
-            group_key = (year, month, day, item.country, item.category)
-            grouped_data[group_key].append(asdict(item))
+        # Group data by date, country, and category for file organization
+        grouped_data: Dict[tuple, list] = defaultdict(list)
+        # Schema type of each category, for typing the Parquet tables
+        category_types: Dict[str, type] = {}
+        saved_ids: List[str] = []
 
-        except Exception as e:
-            print(f"Could not process item {item.id} with date '{item.published_at}'. Skipping. Error: {e}")
-            continue
+        # Bind hot lookups to locals for the loop below
+        parse_pub_at = _parse_pub_at
+        two_digits = _TWO_DIGITS
 
-    # Write each group to a separate file
-    for (year, month, day, country, category), records in grouped_data.items():
-        storage_path = base_data_path / year / month / day
-        storage_path.mkdir(parents=True, exist_ok=True)
+        for item in data:
+            if item.id in seen_ids:
+                continue
+            published_at = item.published_at
+            try:
+                # Handle multiple date formats to get a datetime object
+                if not published_at: continue
 
-        # Each file will contain records for one category for one day
-        file_path = storage_path / f"{country}-{category}.json"
+                dt_obj = parse_pub_at(published_at)
 
+                # Define path and group key
+                group_key = (str(dt_obj.year), two_digits[dt_obj.month], two_digits[dt_obj.day], item.country, item.category)
+                item_type = type(item)
+                record = {n: getattr(item, n) for n in _field_names(item_type)}
+                grouped_data[group_key].append(record)
+                category_types[item.category] = item_type
+                seen_ids.add(item.id)
+                saved_ids.append(item.id)
+
+            except Exception as e:
+                print(f"Could not process item {item.id} with date '{published_at}'. Skipping. Error: {e}")
+                continue
+
+        if skipped_count:
+            print(f"Skipping {skipped_count} items that were already saved.")
+
+        if file_format == "parquet":
+            _write_parquet_dataset(grouped_data, category_types, base_data_path)
+        else:
+            _write_ndjson_files(grouped_data, base_data_path)
+
+        # Only mark items as seen once they are written
+        conn.executemany("INSERT OR IGNORE INTO seen (id) VALUES (?)", ((item_id,) for item_id in saved_ids))
+
+
+def _load_seen_ids(conn: sqlite3.Connection, ids: List[str]) -> Set[str]:
+    """Returns the subset of the given ids that is already in the seen index."""
+    seen: Set[str] = set()
+    for i in range(0, len(ids), _SQLITE_MAX_PARAMS):
+        chunk = ids[i:i + _SQLITE_MAX_PARAMS]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(f"SELECT id FROM seen WHERE id IN ({placeholders})", chunk)
+        seen.update(row[0] for row in rows)
+    return seen
+
+
+def _write_ndjson_files(grouped_data: Dict, base_data_path: Path):
+    """
+    Appends grouped records as NDJSON (one JSON object per line). Every group
+    is serialized first, then all files are written concurrently so the
+    per-file open/write/close latency overlaps.
+    """
+    file_paths: List[Path] = []
+    payloads: List[bytes] = []
+    for (year, month, day, country, category), records in grouped_data.items():
+        # Each file will contain records for one category for one day
+        file_path = base_data_path / year / month / day / f"{country}-{category}.jsonl"
         print(f"Saving {len(records)} records to {file_path}")
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=4)
+        file_paths.append(file_path)
+        payloads.append(b"".join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        # list() re-raises any write error
+        list(executor.map(_append_file, file_paths, payloads))
+
+
+@lru_cache(maxsize=None)
+def _arrow_schema(schema_type: type) -> pa.Schema:
+    """
+    Builds the Arrow schema of a schema dataclass from its field annotations,
+    so that a column that is all None in one run is not written as type null.
+    """
+    type_hints = get_type_hints(schema_type)
+    arrow_fields = []
+    for name in _field_names(schema_type):
+        field_type = type_hints[name]
+        if get_origin(field_type) is Union: # Optional[X]
+            field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+        arrow_fields.append(pa.field(name, _ARROW_TYPES[field_type]))
+    # year/month/day are added to the records as partition values
+    arrow_fields.extend(pa.field(name, pa.string()) for name in _PARTITION_FIELDS[:3])
+    return pa.schema(arrow_fields)
+
+
+def _write_parquet_dataset(grouped_data: Dict, category_types: Dict[str, type], base_data_path: Path):
+    """
+    Writes grouped records as a Parquet dataset with one table per category,
+    since all records of a category share the same schema. The table schema
+    comes from the category's schema type, so it is the same in every run.
+    """
+    category_rows: Dict[str, List[Dict]] = defaultdict(list)
+    for (year, month, day, country, category), records in grouped_data.items():
+        print(f"Saving {len(records)} records to {base_data_path / year / month / day / country / category}")
+        for record in records:
+            record.update(year=year, month=month, day=day)
+        category_rows[category].extend(records)
+
+    partitioning = ds.partitioning(
+        pa.schema([(name, pa.string()) for name in _PARTITION_FIELDS])
+    )
+    # A unique file name per run adds the new records next to the ones
+    # saved by earlier runs instead of replacing them.
+    basename_template = f"part-{uuid.uuid4().hex}-{{i}}.parquet"
+    for category, rows in category_rows.items():
+        ds.write_dataset(
+            pa.Table.from_pylist(rows, schema=_arrow_schema(category_types[category])),
+            base_data_path,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template=basename_template,
+            existing_data_behavior="overwrite_or_ignore",
+        )
+
+
+def _append_file(file_path: Path, payload: bytes):
+    """Appends bytes to a file, creating it and its parent directories if needed."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'ab') as f:
+        f.write(payload)
 
 
-def run_disclosure_collectors(start_date: str, end_date: str) -> List[BaseSchema]:
-    """Runs all implemented disclosure collectors."""
+def run_dart_collector(start_date: str, end_date: str, session: Optional[requests.Session] = None) -> List[BaseSchema]:
+    """Runs the KR DART disclosure collector."""
     all_data: List[BaseSchema] = []
-    # --- Run KR DART Collector ---
     print("\n" + "="*50)
     print("--- Running KR DART Collector ---")
     if os.getenv("DART_API_KEY"):
         try:
-            collector = DartCollector()
+            collector = DartCollector(session=session)
             start_dart = start_date.replace('-', '')
             end_dart = end_date.replace('-', '')
             all_data.extend(collector.fetch_disclosures(start_dart, end_dart))
@@ -89,12 +253,16 @@ def run_disclosure_collectors(start_date: str, end_date: str) -> List[BaseSchema
     else:
         print("Skipping DART collector: DART_API_KEY not set.")
     print("="*50 + "\n")
+    return all_data
+
 
-    # --- Run US EDGAR Collector ---
+def run_edgar_collector(start_date: str, end_date: str, session: Optional[requests.Session] = None) -> List[BaseSchema]:
+    """Runs the US EDGAR disclosure collector."""
+    all_data: List[BaseSchema] = []
     print("\n" + "="*50)
     print("--- Running US EDGAR Collector ---")
     try:
-        collector = EdgarCollector()
+        collector = EdgarCollector(session=session)
         all_data.extend(collector.fetch_disclosures(start_date, end_date))
     except Exception as e:
         print(f"Failed to run EDGAR collector: {e}")
@@ -102,29 +270,18 @@ def run_disclosure_collectors(start_date: str, end_date: str) -> List[BaseSchema
     return all_data
 
 
-def run_news_collectors(start_date: datetime, end_date: datetime) -> List[BaseSchema]:
-    """Runs all implemented news collectors."""
-    all_data: List[BaseSchema] = []
-    collector = NewsCollector()
-
-    # --- Run US News Collector ---
-    all_data.extend(collector.fetch_news(
-        country_code='US',
+def run_news_collector(country_code: str, start_date: datetime, end_date: datetime,
+                       session: Optional[requests.Session] = None) -> List[BaseSchema]:
+    """Runs the news collector for one country ('US' or 'KR')."""
+    collector = NewsCollector(session=session)
+    return collector.fetch_news(
+        country_code=country_code,
         start_date=start_date,
         end_date=end_date,
-        news_sources=US_NEWS_SOURCES,
+        news_sources=US_NEWS_SOURCES if country_code == 'US' else KR_NEWS_SOURCES,
         max_articles_per_day=10 # Limit to 10 per source for this run
-    ))
+    )
 
-    # --- Run KR News Collector ---
-    all_data.extend(collector.fetch_news(
-        country_code='KR',
-        start_date=start_date,
-        end_date=end_date,
-        news_sources=KR_NEWS_SOURCES,
-        max_articles_per_day=10 # Limit to 10 per source for this run
-    ))
-    return all_data
 
 def run_research_collector() -> List[BaseSchema]:
     """Runs the research data collector."""
@@ -143,37 +300,50 @@ def run_research_collector() -> List[BaseSchema]:
     return all_data
 
 
+def run_all_collectors(start_dt: datetime, end_dt: datetime) -> List[BaseSchema]:
+    """
+    Runs every collector concurrently and returns the combined data.
+
+    All collectors are network-bound, so they are coordinated from a single
+    thread pool and share one pooled HTTP session where the underlying
+    client allows it.
+    """
+    start_date_str = start_dt.strftime('%Y-%m-%d')
+    end_date_str = end_dt.strftime('%Y-%m-%d')
+    session = create_session(pool_size=32)
+
+    collector_tasks = [
+        lambda: run_dart_collector(start_date_str, end_date_str, session=session),
+        lambda: run_edgar_collector(start_date_str, end_date_str, session=session),
+        lambda: run_news_collector('US', start_dt, end_dt, session=session),
+        lambda: run_news_collector('KR', start_dt, end_dt, session=session),
+        lambda: run_research_collector(),
+    ]
+    all_data: List[BaseSchema] = []
+    with ThreadPoolExecutor(max_workers=len(collector_tasks)) as executor:
+        futures = [executor.submit(task) for task in collector_tasks]
+        for future in as_completed(futures):
+            all_data.extend(future.result())
+    return all_data
+
+
 if __name__ == '__main__':
     DAYS_TO_FETCH = 2 # Keep it short for testing
 
     end_dt = datetime.now()
     start_dt = end_dt - timedelta(days=DAYS_TO_FETCH)
-    start_date_str = start_dt.strftime('%Y-%m-%d')
-    end_date_str = end_dt.strftime('%Y-%m-%d')
 
     print(f"--- Starting Data Collection Runner ---")
-    print(f"Fetching data from {start_date_str} to {end_date_str}")
+    print(f"Fetching data from {start_dt:%Y-%m-%d} to {end_dt:%Y-%m-%d}")
 
     # Set the base path to a top-level 'data' directory
     base_data_path = Path(__file__).parent.parent.parent.parent / 'data'
-    all_collected_data = []
-
-    # Run Disclosure Collectors
-    disclosure_data = run_disclosure_collectors(start_date=start_date_str, end_date=end_date_str)
-    all_collected_data.extend(disclosure_data)
-
-    # Run News Collectors
-    news_data = run_news_collectors(start_date=start_dt, end_date=end_dt)
-    all_collected_data.extend(news_data)
-
-    # Run Research Collector
-    research_data = run_research_collector()
-    all_collected_data.extend(research_data)
+    all_collected_data = run_all_collectors(start_dt, end_dt)
 
     # --- Save all collected data ---
     if all_collected_data:
         print(f"\nTotal items collected across all sources: {len(all_collected_data)}. Saving data...")
-        save_data(all_collected_data, base_data_path)
+        save_data(all_collected_data, base_data_path, file_format=os.getenv("DATA_FILE_FORMAT", "json"))
     else:
         print("\nNo data collected.")
 
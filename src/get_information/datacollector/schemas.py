@@ -2,13 +2,18 @@
 Defines the data structures (schemas) for the data collected by the system.
 
 Using dataclasses to ensure a consistent structure for the JSON output.
+The schemas use __slots__, so instances carry no per-instance __dict__.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 
-@dataclass
+def _utc_now_iso() -> str:
+    """Returns the current UTC time as a naive ISO-8601 string."""
+    return datetime.utcnow().isoformat()
+
+@dataclass(slots=True)
 class BaseSchema:
     """
     A base class for all schemas. Contains fields that are common and always
@@ -19,7 +24,7 @@ class BaseSchema:
     country: str
     published_at: str
 
-@dataclass
+@dataclass(slots=True)
 class NewsSchema(BaseSchema):
     """Schema for news articles."""
     # Non-default fields specific to News
@@ -29,11 +34,11 @@ class NewsSchema(BaseSchema):
 
     # Fields with default values
     category: str = "news"
-    collected_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    collected_at: str = field(default_factory=_utc_now_iso)
     company_symbol: Optional[str] = None
     duplicate_count: int = 1
 
-@dataclass
+@dataclass(slots=True)
 class DisclosureSchema(BaseSchema):
     """Schema for company disclosures from DART/EDGAR."""
     # Non-default fields specific to Disclosures
@@ -45,10 +50,10 @@ class DisclosureSchema(BaseSchema):
 
     # Fields with default values
     category: str = "disclosure"
-    collected_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    collected_at: str = field(default_factory=_utc_now_iso)
     summary: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ResearchSchema(BaseSchema):
     """Schema for brokerage research reports."""
     # Non-default fields specific to Research
@@ -58,7 +63,7 @@ class ResearchSchema(BaseSchema):
 
     # Fields with default values
     category: str = "research"
-    collected_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    collected_at: str = field(default_factory=_utc_now_iso)
     analyst_name: Optional[str] = None
     rating: Optional[str] = None
     target_price: Optional[float] = None
@@ -1,13 +1,16 @@
 import os
-import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Set
 
-import pandas as pd
-from pykrx import stock
-import OpenDartReader
+import requests
 
 from ..schemas import DisclosureSchema
+from ..utils.http import create_session
+from ..utils.tickers import get_kr_tickers
+
+DART_LIST_URL = "https://opendart.fss.or.kr/api/list.json"
+DART_VIEWER_URL = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
+DART_PAGE_COUNT = 100 # Maximum page size allowed by the API
 
 
 class DartCollector:
@@ -16,7 +19,7 @@ class DartCollector:
     Transfer System) of South Korea's Financial Supervisory Service (FSS).
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initializes the DartCollector.
 
@@ -24,25 +27,24 @@ class DartCollector:
             api_key (str, optional): The DART API key. If not provided, it will
                                      be read from the DART_API_KEY environment
                                      variable.
+            session (requests.Session, optional): The HTTP session used for
+                                                  DART requests. If not provided,
+                                                  a new one is created.
         """
         self.api_key = api_key or os.getenv("DART_API_KEY")
         if not self.api_key:
             raise ValueError("DART API key is required. Please provide it or set the DART_API_KEY environment variable.")
-        self.dart = OpenDartReader(self.api_key)
+        self.session = session or create_session()
 
-    def _get_target_tickers(self) -> List[str]:
+    def _get_target_tickers(self) -> Set[str]:
         """
-        Gets a list of all tickers for KOSPI and KOSDAQ listed companies.
+        Gets the set of all tickers for KOSPI and KOSDAQ listed companies.
 
         Returns:
-            List[str]: A list of stock tickers.
+            Set[str]: A set of unique stock tickers.
         """
-        print("Fetching all KOSPI and KOSDAQ tickers...")
-        kospi_tickers = stock.get_market_ticker_list(market="KOSPI")
-        kosdaq_tickers = stock.get_market_ticker_list(market="KOSDAQ")
-        all_tickers = list(set(kospi_tickers + kosdaq_tickers))
-        print(f"Found {len(all_tickers)} unique tickers.")
-        return all_tickers
+        # Shares the concurrent, cached KOSPI/KOSDAQ lookup with the other collectors
+        return set(get_kr_tickers())
 
     def fetch_disclosures(self, start_date: str, end_date: str) -> List[DisclosureSchema]:
         """
@@ -63,25 +65,48 @@ class DartCollector:
         # rather than iterating through each company.
         print(f"Fetching all disclosures from {start_date} to {end_date}...")
         try:
-            # kind='A' is for regular disclosures (정기공시)
-            df = self.dart.list(start=start_date, end=end_date, kind='A', final=True)
-            if df is None or df.empty:
+            page_no, total_page = 1, 1
+            while page_no <= total_page:
+                params = {
+                    'crtfc_key': self.api_key,
+                    'bgn_de': start_date,
+                    'end_de': end_date,
+                    'pblntf_ty': 'A', # Regular disclosures (정기공시)
+                    'last_reprt_at': 'Y', # Final reports only
+                    'page_no': page_no,
+                    'page_count': DART_PAGE_COUNT,
+                }
+                resp = self.session.get(DART_LIST_URL, params=params, timeout=30)
+                resp.raise_for_status()
+                result = resp.json()
+
+                status = result.get('status')
+                if status == '013': # No data for the query
+                    break
+                if status != '000':
+                    raise RuntimeError(f"DART API error {status}: {result.get('message')}")
+
+                for row in result.get('list', []):
+                    rcept_no = row.get('rcept_no', '')
+                    rcept_dt = row.get('rcept_dt', '')
+                    disclosure = DisclosureSchema(
+                        id=rcept_no,
+                        source='DART',
+                        country='KR',
+                        report_title=row.get('report_nm', ''),
+                        company_name=row.get('corp_name', ''),
+                        company_symbol=row.get('stock_code', ''),
+                        url_to_document=DART_VIEWER_URL.format(rcept_no=rcept_no),
+                        filing_type=row.get('report_nm', ''), # Using report_nm as filing_type
+                        published_at=f"{rcept_dt[:4]}-{rcept_dt[4:6]}-{rcept_dt[6:8]}",
+                    )
+                    all_disclosures.append(disclosure)
+
+                total_page = result.get('total_page', 1)
+                page_no += 1
+
+            if not all_disclosures:
                 print("No disclosures found for the given period.")
-                return []
-
-            for _, row in df.iterrows():
-                disclosure = DisclosureSchema(
-                    id=row.get('rcept_no', ''),
-                    source='DART',
-                    country='KR',
-                    report_title=row.get('report_nm', ''),
-                    company_name=row.get('corp_name', ''),
-                    company_symbol=row.get('stock_code', ''),
-                    url_to_document=row.get('rcept_url', ''),
-                    filing_type=row.get('report_nm', ''), # Using report_nm as filing_type
-                    published_at=pd.to_datetime(row.get('rcept_dt', '')).isoformat(),
-                )
-                all_disclosures.append(disclosure)
 
         except Exception as e:
             print(f"An error occurred while fetching disclosures: {e}")
@@ -1,13 +1,19 @@
 import hashlib
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Optional
 
+import requests
 from gnews import GNews
 from newspaper import Article, Config
 
 from ..schemas import NewsSchema
+from ..utils.dates import rfc2822_to_iso
+from ..utils.http import create_session
 
+# Maximum number of article downloads in flight at once
+MAX_CONCURRENT_DOWNLOADS = 16
 
 class NewsCollector:
     """
@@ -15,12 +21,21 @@ class NewsCollector:
     Newspaper3k for full-text extraction.
     """
 
-    def __init__(self):
-        """Initializes the NewsCollector."""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initializes the NewsCollector.
+
+        Args:
+            session (requests.Session, optional): The HTTP session used to
+                                                  download articles. If not
+                                                  provided, a new one is created.
+        """
         self.user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
         self.article_config = Config()
         self.article_config.browser_user_agent = self.user_agent
         self.article_config.request_timeout = 10
+        # Shared by the download workers so connections to each site are reused
+        self.session = session or create_session(pool_size=MAX_CONCURRENT_DOWNLOADS)
 
     def _get_full_text(self, url: str) -> str:
         """
@@ -33,17 +48,27 @@ class NewsCollector:
             str: The full text of the article, or an empty string if it fails.
         """
         try:
+            resp = self.session.get(
+                url,
+                headers={'User-Agent': self.user_agent},
+                timeout=self.article_config.request_timeout,
+            )
+            resp.raise_for_status()
+            # Without a charset in the header requests decodes the page as
+            # ISO-8859-1; detect the real encoding instead, as newspaper does
+            if 'charset' not in resp.headers.get('Content-Type', '').lower():
+                resp.encoding = resp.apparent_encoding
             article = Article(url, config=self.article_config)
-            article.download()
+            article.download(input_html=resp.text)
             article.parse()
             return article.text
         except Exception as e:
             print(f"  - Failed to download or parse article at {url}. Error: {e}")
             return ""
 
-    def _calculate_hash(self, text: str) -> str:
-        """Calculates a SHA256 hash for a given text."""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    def _calculate_hash(self, text: str) -> bytes:
+        """Calculates a SHA256 digest for a given text."""
+        return hashlib.sha256(text.encode('utf-8')).digest()
 
     def fetch_news(self,
                      country_code: str,
@@ -68,8 +93,13 @@ class NewsCollector:
         gnews = GNews(country=country_code, start_date=start_date, end_date=end_date)
 
         all_articles: List[NewsSchema] = []
-        processed_hashes: Dict[str, NewsSchema] = {}
+        processed_hashes: Dict[bytes, NewsSchema] = {}
+        # Title hash -> every discovered (source_domain, article_data) with that
+        # title, in discovery order. Only one copy of each title is downloaded;
+        # the later copies are counted and serve as fallbacks if it fails.
+        title_copies: Dict[bytes, List[Tuple[str, Dict]]] = {}
 
+        # Discover articles from every source first
         for source_domain in news_sources:
             print(f"\nFetching news from: {source_domain}")
             query = f"site:{source_domain}"
@@ -80,39 +110,68 @@ class NewsCollector:
 
                 # Limit articles to respect the daily limit
                 articles_to_process = articles[:max_articles_per_day]
-
-                for i, article_data in enumerate(articles_to_process):
-                    print(f"  - Processing article {i+1}/{len(articles_to_process)}: {article_data['title']}")
-
-                    full_text = self._get_full_text(article_data['url'])
-                    if not full_text:
-                        continue # Skip if we can't get the content
-
-                    # Use a combination of title and the first 500 chars of text for robust hashing
-                    content_to_hash = article_data['title'] + full_text[:500]
-                    content_hash = self._calculate_hash(content_to_hash)
-
-                    if content_hash in processed_hashes:
-                        print("  - Duplicate found. Incrementing count.")
-                        processed_hashes[content_hash].duplicate_count += 1
-                    else:
-                        # New article, create a schema object
-                        schema = NewsSchema(
-                            id=content_hash,
-                            source=article_data.get('publisher', {}).get('title', source_domain),
-                            country=country_code,
-                            headline=article_data['title'],
-                            url=article_data['url'],
-                            content=full_text,
-                            published_at=article_data['published date'],
-                            duplicate_count=1
-                        )
-                        processed_hashes[content_hash] = schema
-                        all_articles.append(schema)
+                for article_data in articles_to_process:
+                    title_hash = self._calculate_hash(article_data['title'])
+                    if title_hash in title_copies:
+                        print(f"  - Duplicate title found: {article_data['title']}. Skipping download.")
+                        title_copies[title_hash].append((source_domain, article_data))
+                        continue
+                    title_copies[title_hash] = [(source_domain, article_data)]
 
             except Exception as e:
                 print(f"An error occurred while fetching from {source_domain}: {e}")
 
+        # Download the full texts concurrently, one copy per title. Titles whose
+        # copy came back empty retry with their next copy in the following round.
+        # Title hash -> (source_domain, article_data, full_text) of the first copy that downloaded
+        downloaded: Dict[bytes, Tuple[str, Dict, str]] = {}
+        pending = list(title_copies)
+        attempt = 0
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+            while pending:
+                if attempt == 0:
+                    print(f"\nDownloading {len(pending)} articles...")
+                else:
+                    print(f"\nRetrying {len(pending)} articles from another source...")
+                urls = [title_copies[title_hash][attempt][1]['url'] for title_hash in pending]
+                failed = []
+                for title_hash, full_text in zip(pending, executor.map(self._get_full_text, urls)):
+                    if full_text:
+                        downloaded[title_hash] = (*title_copies[title_hash][attempt], full_text)
+                    elif attempt + 1 < len(title_copies[title_hash]):
+                        failed.append(title_hash)
+                pending = failed
+                attempt += 1
+
+        # Deduplicate in discovery order so that the result stays deterministic
+        for title_hash, copies in title_copies.items():
+            if title_hash not in downloaded:
+                continue # Skip if we can't get the content from any copy
+            source_domain, article_data, full_text = downloaded[title_hash]
+
+            # Different titles may still carry the same story, so dedup on
+            # a combination of title and the first 500 chars of text as well
+            content_to_hash = article_data['title'] + full_text[:500]
+            content_hash = self._calculate_hash(content_to_hash)
+
+            if content_hash in processed_hashes:
+                print(f"  - Duplicate found: {article_data['title']}. Incrementing count.")
+                processed_hashes[content_hash].duplicate_count += len(copies)
+            else:
+                # New article, create a schema object
+                schema = NewsSchema(
+                    id=content_hash.hex(),
+                    source=article_data.get('publisher', {}).get('title', source_domain),
+                    country=country_code,
+                    headline=article_data['title'],
+                    url=article_data['url'],
+                    content=full_text,
+                    published_at=rfc2822_to_iso(article_data['published date']), # GNews dates are RFC-2822
+                    duplicate_count=len(copies)
+                )
+                processed_hashes[content_hash] = schema
+                all_articles.append(schema)
+
         print(f"\n--- Finished News Collection for {country_code}. Found {len(all_articles)} unique articles. ---")
         return all_articles
 
@@ -1,13 +1,18 @@
 import os
-import time
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import finnhub
 
 from ..schemas import ResearchSchema
+from ..utils.rate_limit import RateLimiter
 from ..utils.tickers import get_us_tickers, get_kr_tickers
 
+# Finnhub free plan: 60 API calls per minute
+FINNHUB_CALLS_PER_MINUTE = 60
+
 class ResearchCollector:
     """
     Collects analyst recommendations and research data from Finnhub.
@@ -26,6 +31,64 @@ class ResearchCollector:
         if not self.api_key:
             raise ValueError("Finnhub API key is required. Please provide it or set the FINNHUB_API_KEY environment variable.")
         self.client = finnhub.Client(api_key=self.api_key)
+        self.rate_limiter = RateLimiter(FINNHUB_CALLS_PER_MINUTE, period=60.0)
+        self._limit_reached = threading.Event()
+
+    def _fetch_ticker_research(self, ticker: str, country: str) -> List[ResearchSchema]:
+        """
+        Fetches the analyst recommendation trends of a single company.
+
+        Args:
+            ticker (str): The stock ticker of the company.
+            country (str): The country code of the company ('US' or 'KR').
+
+        Returns:
+            List[ResearchSchema]: A list of research data objects.
+        """
+        research: List[ResearchSchema] = []
+        if self._limit_reached.is_set():
+            return research
+
+        self.rate_limiter.acquire()
+        # The limit may have been hit while this worker waited for its slot
+        if self._limit_reached.is_set():
+            return research
+        try:
+            # Finnhub API call for recommendation trends
+            recommendations = self.client.recommendation_trends(ticker)
+        except Exception as e:
+            # Finnhub API often raises a generic Exception with a string message
+            if "API limit reached" in str(e):
+                if not self._limit_reached.is_set():
+                    print("Finnhub API limit reached. Stopping for now.")
+                self._limit_reached.set()
+            else:
+                print(f"Could not fetch recommendations for {ticker}. Error: {e}")
+            return research
+
+        if not recommendations:
+            print(f"  - No recommendation data found for {ticker}.")
+            return research
+
+        for rec in recommendations:
+            # Create a summary rating string
+            rating_summary = f"Buy: {rec.get('buy', 0)}, Hold: {rec.get('hold', 0)}, Sell: {rec.get('sell', 0)}, StrongBuy: {rec.get('strongBuy', 0)}, StrongSell: {rec.get('strongSell', 0)}"
+
+            # Create a unique ID for this record
+            record_id = hashlib.sha256(f"{ticker}{rec.get('period', '')}".encode()).hexdigest()
+
+            schema = ResearchSchema(
+                id=record_id,
+                source="Finnhub",
+                country=country,
+                report_title="Analyst Recommendation Trend",
+                firm_name="Aggregated by Finnhub",
+                company_symbol=rec.get('symbol', ticker),
+                rating=rating_summary,
+                published_at=rec.get('period', ''),
+            )
+            research.append(schema)
+        return research
 
     def fetch_research(self) -> List[ResearchSchema]:
         """
@@ -38,49 +101,19 @@ class ResearchCollector:
         us_tickers = get_us_tickers()
         kr_tickers = get_kr_tickers()
         all_tickers = us_tickers + kr_tickers
+        us_ticker_set = set(us_tickers)
 
         print(f"\nFetching analyst recommendations for {len(all_tickers)} tickers from Finnhub...")
 
-        for i, ticker in enumerate(all_tickers):
-            print(f"[{i+1}/{len(all_tickers)}] Fetching for {ticker}...")
-            try:
-                # Finnhub API call for recommendation trends
-                recommendations = self.client.recommendation_trends(ticker)
-
-                if not recommendations:
-                    print(f"  - No recommendation data found for {ticker}.")
-                    continue
-
-                for rec in recommendations:
-                    # Create a summary rating string
-                    rating_summary = f"Buy: {rec.get('buy', 0)}, Hold: {rec.get('hold', 0)}, Sell: {rec.get('sell', 0)}, StrongBuy: {rec.get('strongBuy', 0)}, StrongSell: {rec.get('strongSell', 0)}"
-
-                    # Create a unique ID for this record
-                    record_id = hashlib.sha256(f"{ticker}{rec.get('period', '')}".encode()).hexdigest()
-
-                    country = "US" if ticker in us_tickers else "KR"
-
-                    schema = ResearchSchema(
-                        id=record_id,
-                        source="Finnhub",
-                        country=country,
-                        report_title="Analyst Recommendation Trend",
-                        firm_name="Aggregated by Finnhub",
-                        company_symbol=rec.get('symbol', ticker),
-                        rating=rating_summary,
-                        published_at=rec.get('period', ''),
-                    )
-                    all_research.append(schema)
-
-                # Respect Finnhub's rate limit (60 calls/minute on free plan)
-                time.sleep(1.1)
-
-            except Exception as e:
-                # Finnhub API often raises a generic Exception with a string message
-                if "API limit reached" in str(e):
-                    print("Finnhub API limit reached. Stopping for now.")
-                    break
-                print(f"Could not fetch recommendations for {ticker}. Error: {e}")
+        # Workers hide the per-request latency while the shared rate limiter
+        # keeps the overall call rate within Finnhub's limit.
+        self._limit_reached.clear()
+        countries = ["US" if ticker in us_ticker_set else "KR" for ticker in all_tickers]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(self._fetch_ticker_research, all_tickers, countries)
+            for i, (ticker, research) in enumerate(zip(all_tickers, results)):
+                print(f"[{i+1}/{len(all_tickers)}] Fetched {ticker}")
+                all_research.extend(research)
 
         print(f"\nSuccessfully collected {len(all_research)} research records.")
         return all_research
@@ -1,21 +1,31 @@
 import os
-import time
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, date
+from typing import List, Optional, Dict
 
-import edgar
+import requests
 
 from ..schemas import DisclosureSchema
+from ..utils.http import create_session
+from ..utils.rate_limit import RateLimiter
 from ..utils.tickers import get_us_tickers
 
+# SEC fair access policy: at most 10 requests per second.
+SEC_REQUESTS_PER_SECOND = 10
+SEC_ARCHIVES_URL = "https://www.sec.gov/Archives"
+SEC_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
 
 class EdgarCollector:
     """
     Collects public company disclosures from the U.S. Securities and Exchange
     Commission (SEC) EDGAR database.
+
+    Instead of querying every company separately, the collector downloads the
+    EDGAR daily master index (one file per business day listing every filing)
+    and keeps only the filings of the target companies.
     """
 
-    def __init__(self, user_agent: Optional[str] = None):
+    def __init__(self, user_agent: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initializes the EdgarCollector.
 
@@ -24,10 +34,67 @@ class EdgarCollector:
                                         client to the SEC. It should be in the
                                         format "Sample Company Name AdminContact@example.com".
                                         If not provided, a default will be used.
+            session (requests.Session, optional): The HTTP session used for
+                                                  SEC requests. If not provided,
+                                                  a new one is created.
         """
         self.user_agent = user_agent or "GoToTheMoon Project jules@example.com"
-        edgar.set_identity(self.user_agent)
+        self.headers = {'User-Agent': self.user_agent}
+        self.session = session or create_session()
         print(f"EDGAR identity set to: '{self.user_agent}'")
+        self.rate_limiter = RateLimiter(SEC_REQUESTS_PER_SECOND)
+
+    def _get(self, url: str) -> requests.Response:
+        """Performs a rate-limited GET request against the SEC servers."""
+        self.rate_limiter.acquire()
+        return self.session.get(url, headers=self.headers, timeout=30)
+
+    def _get_cik_map(self, tickers: List[str]) -> Dict[str, str]:
+        """
+        Maps the CIKs of the given tickers to their tickers.
+
+        Args:
+            tickers (List[str]): A list of stock tickers.
+
+        Returns:
+            Dict[str, str]: A dictionary of CIK (without leading zeros) -> ticker.
+        """
+        resp = self._get(SEC_COMPANY_TICKERS_URL)
+        resp.raise_for_status()
+        target_tickers = set(tickers)
+        return {
+            str(entry['cik_str']): entry['ticker']
+            for entry in resp.json().values()
+            if entry['ticker'] in target_tickers
+        }
+
+    def _fetch_daily_index(self, day: date) -> List[List[str]]:
+        """
+        Downloads the EDGAR daily master index for a given day.
+
+        Args:
+            day (date): The filing date.
+
+        Returns:
+            List[List[str]]: The index rows as [CIK, Company Name, Form Type,
+                             Date Filed, Filename]. Empty if no index exists
+                             for that day (e.g. holidays).
+        """
+        quarter = (day.month - 1) // 3 + 1
+        url = f"{SEC_ARCHIVES_URL}/edgar/daily-index/{day.year}/QTR{quarter}/master.{day:%Y%m%d}.idx"
+        resp = self._get(url)
+        if resp.status_code == 404:
+            return []
+        # Anything else, including a 403 when SEC blocks the request, is an error
+        resp.raise_for_status()
+
+        # The rows follow a header block terminated by a line of dashes
+        lines = resp.content.decode('latin-1').splitlines()
+        for i, line in enumerate(lines):
+            if line.startswith('---'):
+                lines = lines[i + 1:]
+                break
+        return [row for row in (line.split('|') for line in lines) if len(row) == 5]
 
     def fetch_disclosures(self, start_date: str, end_date: str) -> List[DisclosureSchema]:
         """
@@ -43,35 +110,42 @@ class EdgarCollector:
         """
         all_disclosures: List[DisclosureSchema] = []
         tickers = get_us_tickers(self.user_agent)
-
-        date_range = f"{start_date}:{end_date}"
-        print(f"\nFetching EDGAR disclosures for {len(tickers)} tickers from {date_range}...")
-
-        for i, ticker in enumerate(tickers):
-            print(f"[{i+1}/{len(tickers)}] Fetching for {ticker}...")
-            try:
-                company = edgar.Company(ticker)
-                filings = company.get_filings(filing_date=date_range)
-
-                for filing in filings:
+        try:
+            cik_map = self._get_cik_map(tickers)
+        except Exception as e:
+            print(f"Could not fetch the SEC ticker to CIK mapping. Error: {e}")
+            return all_disclosures
+
+        print(f"\nFetching EDGAR disclosures for {len(cik_map)} companies from {start_date} to {end_date}...")
+
+        day = date.fromisoformat(start_date)
+        last_day = date.fromisoformat(end_date)
+        while day <= last_day:
+            if day.weekday() < 5: # EDGAR does not publish indexes on weekends
+                print(f"Fetching daily index for {day.isoformat()}...")
+                try:
+                    rows = self._fetch_daily_index(day)
+                except Exception as e:
+                    print(f"Could not fetch the daily index for {day.isoformat()}. Error: {e}")
+                    rows = []
+
+                for cik, company_name, form, date_filed, filename in rows:
+                    ticker = cik_map.get(cik)
+                    if ticker is None:
+                        continue
                     disclosure = DisclosureSchema(
-                        id=filing.accession_no,
+                        id=filename.rsplit('/', 1)[-1].removesuffix('.txt'), # accession number
                         source='EDGAR',
                         country='US',
-                        report_title=filing.form, # e.g. 10-K, 8-K
-                        company_name=company.name,
+                        report_title=form, # e.g. 10-K, 8-K
+                        company_name=company_name,
                         company_symbol=ticker,
-                        url_to_document=filing.url,
-                        filing_type=filing.form,
-                        published_at=filing.filing_date.isoformat(),
+                        url_to_document=f"{SEC_ARCHIVES_URL}/{filename}",
+                        filing_type=form,
+                        published_at=f"{date_filed[:4]}-{date_filed[4:6]}-{date_filed[6:8]}",
                     )
                     all_disclosures.append(disclosure)
-
-                # SEC rate limit: 10 requests per second.
-                time.sleep(0.1)
-
-            except Exception as e:
-                print(f"Could not fetch filings for {ticker}. Error: {e}")
+            day += timedelta(days=1)
 
         print(f"\nSuccessfully collected {len(all_disclosures)} disclosures.")
         return all_disclosures
@@ -0,0 +1,30 @@
+import re
+from datetime import datetime, timezone
+
+# RFC-2822 dates as returned by GNews, e.g. 'Mon, 14 Oct 2024 07:00:00 GMT'
+_RFC2822_RE = re.compile(r'\w{3}, (\d{1,2}) (\w{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2})')
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+def parse_rfc2822(value: str) -> datetime:
+    """
+    Parses an RFC-2822 GMT date string into a UTC datetime.
+    Uses a precompiled regex instead of the much slower strptime('%Z').
+    """
+    match = _RFC2822_RE.match(value)
+    if not match or match.group(2) not in _MONTHS:
+        raise ValueError(f"Unrecognized date format: '{value}'")
+    day, mon, year, hour, minute, second = match.groups()
+    return datetime(int(year), _MONTHS[mon], int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc)
+
+def rfc2822_to_iso(value: str) -> str:
+    """
+    Converts an RFC-2822 date string to ISO-8601. Values in any other format
+    are returned unchanged.
+    """
+    try:
+        return parse_rfc2822(value).isoformat()
+    except (TypeError, ValueError):
+        return value
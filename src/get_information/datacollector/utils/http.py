@@ -0,0 +1,22 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def create_session(pool_size: int = 16) -> requests.Session:
+    """
+    Creates a requests Session that keeps connections alive across requests
+    and retries transient failures with an exponential backoff.
+
+    Args:
+        pool_size (int): The maximum number of pooled connections per host.
+                         Should be at least the number of concurrent workers.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
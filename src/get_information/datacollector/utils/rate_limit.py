@@ -0,0 +1,34 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    A thread-safe rate limiter that spaces calls evenly so that no more than
+    `calls` are made per `period` seconds, regardless of how many worker
+    threads share it.
+    """
+
+    def __init__(self, calls: int, period: float = 1.0):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            calls (int): The maximum number of calls allowed per period.
+            period (float): The length of the period in seconds.
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period must be positive")
+        self.interval = period / calls
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self):
+        """Blocks until the caller is allowed to make its next call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -1,20 +1,71 @@
-from typing import List
-import requests
-from bs4 import BeautifulSoup
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Tuple
+from lxml import html
 from pykrx import stock
 
+from .http import create_session
+
+_session = create_session()
+
+TICKER_CACHE_DIR = Path.home() / '.cache' / 'gotothemoon' / 'tickers'
+TICKER_CACHE_TTL = 24 * 60 * 60 # seconds
+
+SP500_URL = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
+NASDAQ100_URL = 'https://en.wikipedia.org/wiki/Nasdaq-100'
+
+# In-process cache of the combined ticker lists, keyed by their sources only
+# (not the user agent). Each list is filled under its own lock, so collectors
+# asking for it at the same time trigger a single fetch.
+_tickers_cache: Dict[Tuple[str, ...], List[str]] = {}
+_us_tickers_lock = threading.Lock()
+_kr_tickers_lock = threading.Lock()
+
+def _disk_cached(func):
+    """
+    Caches a scraper's ticker list on disk for TICKER_CACHE_TTL seconds, keyed
+    by (url, table_index, symbol_col). Empty results (failed scrapes) are not
+    cached.
+    """
+    @wraps(func)
+    def wrapper(url: str, table_index: int, symbol_col: int, user_agent: str) -> List[str]:
+        key = hashlib.sha1(f"{url}|{table_index}|{symbol_col}".encode()).hexdigest()
+        cache_path = TICKER_CACHE_DIR / f"{key}.json"
+        try:
+            cached = json.loads(cache_path.read_text())
+            if time.time() - cached['ts'] < TICKER_CACHE_TTL:
+                return cached['tickers']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        tickers = func(url, table_index, symbol_col, user_agent)
+        if tickers:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps({'ts': time.time(), 'tickers': tickers}))
+            except OSError as e:
+                print(f"Could not cache tickers from {url}. Error: {e}")
+        return tickers
+    return wrapper
+
+@_disk_cached
 def _scrape_wiki_tickers(url: str, table_index: int, symbol_col: int, user_agent: str) -> List[str]:
     """Helper to scrape tickers from a Wikipedia table."""
     try:
-        resp = requests.get(url, headers={'User-Agent': user_agent})
+        resp = _session.get(url, headers={'User-Agent': user_agent}, timeout=30)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        table = soup.find_all('table', {'class': 'wikitable'})[table_index]
-        tickers = []
-        for row in table.find_all('tr')[1:]:
-            ticker = row.find_all('td')[symbol_col].text.strip()
-            tickers.append(ticker)
-        return tickers
+        # lxml's C parser works on the raw bytes, without decoding them to str first
+        doc = html.fromstring(resp.content)
+        table = doc.xpath("//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]")[table_index]
+        # Symbol cell of every row after the header; text_content() includes
+        # the text of the links that wrap most symbols
+        cells = table.xpath(f"(.//tr)[position() > 1]/td[{symbol_col + 1}]")
+        return [cell.text_content().strip() for cell in cells]
     except Exception as e:
         print(f"Could not scrape tickers from {url}. Error: {e}")
         return []
@@ -22,29 +73,51 @@ def _scrape_wiki_tickers(url: str, table_index: int, symbol_col: int, user_agent
 def get_us_tickers(user_agent: str = "GoToTheMoon Project/1.0") -> List[str]:
     """
     Gets a combined list of S&P 500 and NASDAQ-100 tickers.
+    The result is cached for the process once both pages were scraped, so
+    callers must not modify the returned list.
     """
-    print("Fetching S&P 500 tickers...")
-    sp500 = _scrape_wiki_tickers(
-        'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies', 0, 0, user_agent
-    )
-    print("Fetching NASDAQ-100 tickers...")
-    nasdaq100 = _scrape_wiki_tickers(
-        'https://en.wikipedia.org/wiki/Nasdaq-100', 4, 1, user_agent
-    )
-
-    all_tickers = sorted(list(set(sp500 + nasdaq100)))
-    print(f"Found {len(all_tickers)} unique US tickers.")
-    # Replace dots with dashes for tickers like 'BRK.B' -> 'BRK-B' for some APIs
-    all_tickers = [ticker.replace('.', '-') for ticker in all_tickers]
-    return all_tickers
+    cache_key = (SP500_URL, NASDAQ100_URL)
+    with _us_tickers_lock:
+        if cache_key in _tickers_cache:
+            return _tickers_cache[cache_key]
+
+        print("Fetching S&P 500 and NASDAQ-100 tickers...")
+        # Both pages are fetched concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sp500_future = executor.submit(_scrape_wiki_tickers, SP500_URL, 0, 0, user_agent)
+            nasdaq100_future = executor.submit(_scrape_wiki_tickers, NASDAQ100_URL, 4, 1, user_agent)
+            sp500 = sp500_future.result()
+            nasdaq100 = nasdaq100_future.result()
+
+        # Replace dots with dashes for tickers like 'BRK.B' -> 'BRK-B' for some APIs,
+        # deduplicating in the same pass
+        all_tickers = sorted({ticker.replace('.', '-') for ticker in sp500} | {ticker.replace('.', '-') for ticker in nasdaq100})
+        print(f"Found {len(all_tickers)} unique US tickers.")
+        # A failed scrape returns []; keep the partial list out of the cache
+        if sp500 and nasdaq100:
+            _tickers_cache[cache_key] = all_tickers
+        return all_tickers
 
 def get_kr_tickers() -> List[str]:
     """
     Gets a list of all tickers for KOSPI and KOSDAQ listed companies.
+    The result is cached for the process once both markets were fetched, so
+    callers must not modify the returned list.
     """
-    print("Fetching all KOSPI and KOSDAQ tickers...")
-    kospi_tickers = stock.get_market_ticker_list(market="KOSPI")
-    kosdaq_tickers = stock.get_market_ticker_list(market="KOSDAQ")
-    all_tickers = sorted(list(set(kospi_tickers + kosdaq_tickers)))
-    print(f"Found {len(all_tickers)} unique KR tickers.")
-    return all_tickers
+    cache_key = ("KOSPI", "KOSDAQ")
+    with _kr_tickers_lock:
+        if cache_key in _tickers_cache:
+            return _tickers_cache[cache_key]
+
+        print("Fetching all KOSPI and KOSDAQ tickers...")
+        # Both markets are fetched concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kospi_future = executor.submit(stock.get_market_ticker_list, market="KOSPI")
+            kosdaq_future = executor.submit(stock.get_market_ticker_list, market="KOSDAQ")
+            kospi_tickers = kospi_future.result()
+            kosdaq_tickers = kosdaq_future.result()
+        all_tickers = sorted({*kospi_tickers, *kosdaq_tickers})
+        print(f"Found {len(all_tickers)} unique KR tickers.")
+        if kospi_tickers and kosdaq_tickers:
+            _tickers_cache[cache_key] = all_tickers
+        return all_tickers
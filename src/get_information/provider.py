@@ -1,30 +1,41 @@
 import pandas as pd
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Union
 
 class DataProvider:
     """
     Provides historical stock data.
     In a real application, this would fetch data from a database or a financial data API.
-    For this example, it will read data from a local CSV file.
+    For this example, it will read data from a local CSV or Parquet file.
     """
     def __init__(self, data_path: str):
         """
         Initializes the DataProvider.
 
         Args:
-            data_path (str): The path to the CSV file containing the stock data.
+            data_path (str): The path to the CSV or Parquet (.parquet) file
+                             containing the stock data.
         """
         self.data_path = data_path
         self.dataframe = self._load_data()
+        self._ticker_columns = self._index_ticker_columns()
 
     def _load_data(self) -> pd.DataFrame:
         """
-        Loads data from the CSV file and prepares it.
+        Loads data from the CSV or Parquet file and prepares it.
         """
         try:
-            df = pd.read_csv(self.data_path)
-            df['Date'] = pd.to_datetime(df['Date'])
-            df.set_index('Date', inplace=True)
+            if Path(self.data_path).suffix == '.parquet':
+                # Parquet is columnar and typed; the Date index is stored as timestamps
+                df = pd.read_parquet(self.data_path, engine='pyarrow')
+            else:
+                df = pd.read_csv(self.data_path, parse_dates=['Date'], index_col='Date')
+            # float32 halves the memory traffic of the price columns. Its ~1e-7
+            # relative precision is far below any bid/ask spread.
+            df = df.astype({col: 'float32' for col in df.columns if df[col].dtype == 'float64'})
+            # Date slicing in get_data relies on a sorted index
+            if not df.index.is_monotonic_increasing:
+                df.sort_index(inplace=True)
             return df
         except FileNotFoundError:
             # Return an empty DataFrame if the file doesn't exist yet
@@ -32,6 +43,29 @@ class DataProvider:
             print(f"Warning: Data file not found at {self.data_path}. Returning empty DataFrame.")
             return pd.DataFrame()
 
+    def _index_ticker_columns(self) -> Dict[str, Tuple[Union[slice, List[int]], List[str]]]:
+        """
+        Groups the columns by ticker once, so get_data does not have to scan
+        every column for every requested ticker.
+
+        Returns:
+            Dict[str, Tuple[Union[slice, List[int]], List[str]]]: For each ticker,
+                the positions of its columns (a slice when they are adjacent)
+                and their names without the ticker prefix (e.g. 'AAPL_Open' -> 'Open').
+        """
+        ticker_columns: Dict[str, Tuple[Union[slice, List[int]], List[str]]] = {}
+        for position, col in enumerate(self.dataframe.columns):
+            ticker, _, field = col.partition('_')
+            positions, names = ticker_columns.setdefault(ticker, ([], []))
+            positions.append(position)
+            names.append(field)
+        # A ticker's columns are usually adjacent; a slice selects them as a
+        # view instead of gathering them into a new block
+        for ticker, (positions, names) in ticker_columns.items():
+            if positions[-1] - positions[0] == len(positions) - 1:
+                ticker_columns[ticker] = (slice(positions[0], positions[-1] + 1), names)
+        return ticker_columns
+
     def get_data(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
         """
         Retrieves historical data for the given tickers and date range.
@@ -50,18 +84,37 @@ class DataProvider:
         if self.dataframe.empty:
             return data
 
+        # Binary search the sorted index instead of masking it for every ticker
+        start = self.dataframe.index.searchsorted(pd.Timestamp(start_date), side='left')
+        end = self.dataframe.index.searchsorted(pd.Timestamp(end_date), side='right')
+
         for ticker in tickers:
             # Assuming columns are named like 'AAPL_Open', 'AAPL_High', etc.
-            ticker_cols = [col for col in self.dataframe.columns if col.startswith(ticker)]
-            if not ticker_cols:
+            if ticker not in self._ticker_columns:
                 continue
+            positions, names = self._ticker_columns[ticker]
 
-            ticker_df = self.dataframe[ticker_cols].copy()
-            # Rename columns to remove ticker prefix (e.g., 'AAPL_Open' -> 'Open')
-            ticker_df.columns = [col.split('_')[1] for col in ticker_cols]
-
-            # Filter by date
-            mask = (ticker_df.index >= start_date) & (ticker_df.index <= end_date)
-            data[ticker] = ticker_df.loc[mask]
+            ticker_df = self.dataframe.iloc[start:end, positions]
+            ticker_df.columns = names
+            data[ticker] = ticker_df
 
         return data
+
+
+def convert_csv_to_parquet(csv_path: str, parquet_path: Optional[str] = None) -> str:
+    """
+    Converts a stock data CSV file to Parquet, which DataProvider loads much
+    faster than CSV.
+
+    Args:
+        csv_path (str): The path to the CSV file containing the stock data.
+        parquet_path (str, optional): The output path. Defaults to the CSV path
+                                      with a '.parquet' suffix.
+
+    Returns:
+        str: The path of the written Parquet file.
+    """
+    parquet_path = parquet_path or str(Path(csv_path).with_suffix('.parquet'))
+    df = pd.read_csv(csv_path, parse_dates=['Date'], index_col='Date')
+    df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+    return parquet_path
@@ -21,6 +21,42 @@ class SimpleMAStrategy:
         self.short_window = short_window
         self.long_window = long_window
 
+    def generate_signals_array(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Generates trading signals as an integer array.
+
+        Args:
+            data (pd.DataFrame): A DataFrame containing at least a 'Close' price column.
+
+        Returns:
+            np.ndarray: An int8 array aligned with data's rows, holding 1 (BUY),
+                        -1 (SELL) or 0 (HOLD).
+        """
+        if len(data) < self.long_window:
+            return np.zeros(len(data), dtype=np.int8)
+
+        # Calculate moving averages
+        close = data['Close'].to_numpy()
+        return _crossover_signals(_sma(close, self.short_window), _sma(close, self.long_window))
+
+    def generate_signals_batch(self, close: np.ndarray) -> np.ndarray:
+        """
+        Generates trading signals for many tickers at once.
+
+        Args:
+            close (np.ndarray): A (dates x tickers) array of close prices, one
+                                column per ticker.
+
+        Returns:
+            np.ndarray: A (dates x tickers) int8 array holding 1 (BUY),
+                        -1 (SELL) or 0 (HOLD).
+        """
+        if len(close) < self.long_window:
+            return np.zeros(close.shape, dtype=np.int8)
+
+        # One pass over all columns instead of one rolling window per ticker
+        return _crossover_signals(_sma(close, self.short_window), _sma(close, self.long_window))
+
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
         Generates trading signals for the given historical data.
@@ -31,24 +67,63 @@ class SimpleMAStrategy:
         Returns:
             pd.Series: A Series of trading signals ('BUY', 'SELL', 'HOLD') indexed by date.
         """
-        if len(data) < self.long_window:
-            return pd.Series('HOLD', index=data.index, name='signal')
+        # Index -1 wraps around to 'SELL'
+        labels = np.array(['HOLD', 'BUY', 'SELL'], dtype=object)
+        return pd.Series(labels[self.generate_signals_array(data)], index=data.index, name='signal')
 
-        signals = pd.DataFrame(index=data.index)
 
-        # Calculate moving averages
-        signals['short_mavg'] = data['Close'].rolling(window=self.short_window, min_periods=self.short_window).mean()
-        signals['long_mavg'] = data['Close'].rolling(window=self.long_window, min_periods=self.long_window).mean()
+def _sma(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Computes the simple moving average along the first axis in O(n) from the
+    differences of a running sum, with no per-window work.
 
-        # Create a 'position' column: 1 if short > long, -1 if short < long
-        signals['position'] = np.sign(signals['short_mavg'] - signals['long_mavg'])
+    Like rolling(window, min_periods=window).mean(), the average is NaN until
+    `window` values are available and for every window containing a NaN.
 
-        # The signal is the change from bearish (-1) to bullish (1) -> BUY (diff=2)
-        # or from bullish (1) to bearish (-1) -> SELL (diff=-2)
-        signals['signal_val'] = signals['position'].diff()
+    Args:
+        values (np.ndarray): A 1-D series or a (dates x tickers) array.
+        window (int): The number of values to average.
+
+    Returns:
+        np.ndarray: A float64 array of the same shape as values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    averages = np.full(values.shape, np.nan)
+    if len(values) < window:
+        return averages
+
+    missing = np.isnan(values)
+    # Running sums with a leading zero row, accumulated in float64
+    sums = np.zeros((len(values) + 1,) + values.shape[1:])
+    np.cumsum(np.where(missing, 0.0, values), axis=0, out=sums[1:])
+    averages[window - 1:] = (sums[window:] - sums[:-window]) / window
+
+    if missing.any():
+        missing_counts = np.zeros(sums.shape, dtype=np.int64)
+        np.cumsum(missing, axis=0, out=missing_counts[1:])
+        averages[window - 1:][(missing_counts[window:] - missing_counts[:-window]) > 0] = np.nan
+    return averages
+
+
+def _crossover_signals(short_mavg: np.ndarray, long_mavg: np.ndarray) -> np.ndarray:
+    """
+    Turns short and long moving averages into crossover signals along the
+    first (date) axis.
+
+    Returns:
+        np.ndarray: An int8 array of the same shape holding 1 (BUY), -1 (SELL)
+                    or 0 (HOLD).
+    """
+    signals = np.zeros(short_mavg.shape, dtype=np.int8)
 
-        signals['signal'] = 'HOLD'
-        signals.loc[signals['signal_val'] == 2.0, 'signal'] = 'BUY'
-        signals.loc[signals['signal_val'] == -2.0, 'signal'] = 'SELL'
+    # Position: 1 if short > long, -1 if short < long, 0 while the averages are
+    # undefined (comparisons with NaN are False). Kept as int8 so the diff
+    # below runs on narrow data.
+    position = (short_mavg > long_mavg).astype(np.int8) - (short_mavg < long_mavg).astype(np.int8)
 
-        return signals['signal']
+    # The signal is the change from bearish (-1) to bullish (1) -> BUY (diff=2)
+    # or from bullish (1) to bearish (-1) -> SELL (diff=-2)
+    change = np.diff(position, axis=0)
+    signals[1:][change == 2] = 1
+    signals[1:][change == -2] = -1
+    return signals
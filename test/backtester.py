@@ -1,6 +1,120 @@
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import reduce
+from numba import njit
+
+# Integer encoding of the strategy signals used by the simulation arrays
+SIGNAL_CODES = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
+# Fraction of the available cash invested on each BUY signal
+BUY_ALLOCATION = 0.1
+# Record layout of the portfolio history: one (date, value) row per simulated date
+PORTFOLIO_HISTORY_DTYPE = np.dtype([('date', 'datetime64[ns]'), ('value', 'f8')])
+
+
+@njit(cache=True)
+def _simulate(close, signals, cash, alloc_frac):
+    """
+    Steps through the backtest over (dates x tickers) price and signal arrays.
+
+    Trades are executed in ticker order because they share the cash. Missing
+    prices (NaN) are skipped. Prices may be float32, but cash and values are
+    accumulated in float64.
+
+    Returns:
+        value_hist (np.ndarray): The portfolio value at each date.
+        shares (np.ndarray): The number of shares held per ticker at the end.
+        values (np.ndarray): The last valued holding per ticker.
+        cash (float): The remaining cash.
+        trades (np.ndarray): One (date index, ticker index, shares, price) row
+                             per trade; shares are negative for sells.
+    """
+    num_dates, num_tickers = close.shape
+    shares = np.zeros(num_tickers, dtype=np.int64)
+    values = np.zeros(num_tickers)
+    value_hist = np.empty(num_dates)
+    # Every trade needs a signal, which bounds the number of trades
+    trades = np.empty((np.count_nonzero(signals), 4))
+    num_trades = 0
+
+    for i in range(num_dates):
+        # Update portfolio value with current prices
+        portfolio_value = cash
+        for k in range(num_tickers):
+            price = np.float64(close[i, k])
+            if not np.isnan(price):
+                values[k] = shares[k] * price
+                portfolio_value += values[k]
+        value_hist[i] = portfolio_value
+
+        # Execute trades
+        for k in range(num_tickers):
+            signal = signals[i, k]
+            price = np.float64(close[i, k])
+            if signal == 0 or np.isnan(price):
+                continue
+            if signal == 1 and cash > price:
+                shares_to_buy = int(cash * alloc_frac / price)
+                if shares_to_buy > 0:
+                    cash -= shares_to_buy * price
+                    shares[k] += shares_to_buy
+                    trades[num_trades, 0] = i
+                    trades[num_trades, 1] = k
+                    trades[num_trades, 2] = shares_to_buy
+                    trades[num_trades, 3] = price
+                    num_trades += 1
+            elif signal == -1 and shares[k] > 0:
+                cash += shares[k] * price
+                trades[num_trades, 0] = i
+                trades[num_trades, 1] = k
+                trades[num_trades, 2] = -shares[k]
+                trades[num_trades, 3] = price
+                num_trades += 1
+                shares[k] = 0
+
+    return value_hist, shares, values, cash, trades[:num_trades]
+
+
+@njit(cache=True)
+def _drawdown_and_return_stats(values):
+    """
+    Computes the maximum drawdown and the daily return statistics in a single
+    pass over the portfolio values, without intermediate arrays.
+
+    Returns:
+        max_drawdown (float): The most negative (value - peak) / peak.
+        mean_return (float): The mean of the daily returns.
+        std_return (float): The sample (ddof=1) standard deviation of the daily
+                            returns, or NaN with fewer than two returns.
+    """
+    peak = values[0]
+    max_drawdown = 0.0
+    # Welford's running mean and sum of squared deviations
+    num_returns = 0
+    mean_return = 0.0
+    m2 = 0.0
+    for i in range(1, len(values)):
+        if values[i] > peak:
+            peak = values[i]
+        # Compiled code raises ZeroDivisionError, so undefined drawdowns and
+        # returns on a zero value are skipped (pandas would yield NaN/inf)
+        if peak != 0:
+            drawdown = (values[i] - peak) / peak
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+
+        if values[i - 1] == 0:
+            continue
+        daily_return = (values[i] - values[i - 1]) / values[i - 1]
+        num_returns += 1
+        delta = daily_return - mean_return
+        mean_return += delta / num_returns
+        m2 += delta * (daily_return - mean_return)
+
+    std_return = np.sqrt(m2 / (num_returns - 1)) if num_returns > 1 else np.nan
+    return max_drawdown, mean_return, std_return
+
 
 class Backtester:
     """
@@ -28,7 +142,7 @@ class Backtester:
         self.cash = initial_capital
         self.portfolio = {ticker: {'shares': 0, 'value': 0.0} for ticker in self.tickers}
         self.trade_log = []
-        self.portfolio_history = []
+        self.portfolio_history = np.empty(0, dtype=PORTFOLIO_HISTORY_DTYPE)
 
     def run(self):
         """
@@ -40,57 +154,77 @@ class Backtester:
             print("No data available for the given tickers and date range. Aborting backtest.")
             return None
 
+        # --- Use a unified date index from the actual data ---
+        # Index.union sort-merges the datetime64 values without boxing Timestamps
+        unified_dates = reduce(pd.Index.union, (df.index for df in all_data.values())).sort_values()
+        # Parse the bounds once and slice the sorted dates by binary search
+        start_ts, end_ts = pd.Timestamp(self.start_date), pd.Timestamp(self.end_date)
+        sim_dates = unified_dates[unified_dates.searchsorted(start_ts, side='left'):unified_dates.searchsorted(end_ts, side='right')]
+
+        # --- Align prices into a (dates x tickers) array ---
+        # Missing prices are NaN.
+        num_dates, num_tickers = len(sim_dates), len(self.tickers)
+        close = np.full((num_dates, num_tickers), np.nan, dtype=np.float32)
+        # (column, ticker, row of each data row in sim_dates, whether the row is in sim_dates)
+        ticker_rows = []
+        for k, ticker in enumerate(self.tickers):
+            if ticker not in all_data or all_data[ticker].empty:
+                continue
+            df = all_data[ticker]
+            rows = sim_dates.get_indexer(df.index)
+            in_range = rows >= 0
+            close[rows[in_range], k] = df['Close'].to_numpy()[in_range]
+            ticker_rows.append((k, ticker, rows, in_range))
+
         # --- Pre-calculate all signals for efficiency ---
-        all_signals = {}
-        for ticker in self.tickers:
-            if ticker in all_data and not all_data[ticker].empty:
-                all_signals[ticker] = self.strategy.generate_signals(all_data[ticker])
+        # Signals are encoded as 1 (BUY), -1 (SELL), 0 (HOLD).
+        signals = np.zeros((num_dates, num_tickers), dtype=np.int8)
+        # When every ticker has a row for every date, each close column is exactly
+        # that ticker's own series and all signals come from one batched call.
+        all_aligned = len(ticker_rows) == num_tickers and all(
+            len(rows) == num_dates and in_range.all() for _, _, rows, in_range in ticker_rows
+        )
+        if all_aligned and hasattr(self.strategy, 'generate_signals_batch'):
+            signals[:] = self.strategy.generate_signals_batch(close)
+        else:
+            # Tickers are independent, so they are computed concurrently (the
+            # NumPy cumsum and comparison kernels of the strategy release the GIL).
+            with ThreadPoolExecutor() as executor:
+                signal_arrays = executor.map(self._generate_signal_codes, [all_data[ticker] for _, ticker, _, _ in ticker_rows])
+                for (k, _, rows, in_range), codes in zip(ticker_rows, signal_arrays):
+                    signals[rows[in_range], k] = codes[in_range]
 
-        # --- Use a unified date index from the actual data ---
-        unified_dates = sorted(list(set.union(*(set(df.index) for df in all_data.values()))))
-        sim_dates = [d for d in unified_dates if pd.to_datetime(self.start_date) <= d <= pd.to_datetime(self.end_date)]
-
-        # --- Main simulation loop ---
-        for date in sim_dates:
-            current_date_str = date.strftime('%Y-%m-%d')
-            portfolio_value = self.cash
-
-            for ticker in self.tickers:
-                # Update portfolio value with current price
-                if ticker in all_data and date in all_data[ticker].index:
-                    current_price = all_data[ticker].loc[date]['Close']
-                    portfolio_value += self.portfolio[ticker]['shares'] * current_price
-                    self.portfolio[ticker]['value'] = self.portfolio[ticker]['shares'] * current_price
-
-                    # Look up pre-calculated signal
-                    signal = all_signals[ticker].get(date, 'HOLD')
-
-                    # Execute trades
-                    if signal == 'BUY' and self.cash > current_price:
-                        investment_amount = self.cash * 0.1
-                        shares_to_buy = int(investment_amount / current_price)
-                        if shares_to_buy > 0:
-                            cost = shares_to_buy * current_price
-                            self.cash -= cost
-                            self.portfolio[ticker]['shares'] += shares_to_buy
-                            self.trade_log.append(f"{current_date_str}: BOUGHT {shares_to_buy} {ticker} @ {current_price:.2f}")
-
-                    elif signal == 'SELL' and self.portfolio[ticker]['shares'] > 0:
-                        shares_to_sell = self.portfolio[ticker]['shares']
-                        revenue = shares_to_sell * current_price
-                        self.cash += revenue
-                        self.portfolio[ticker]['shares'] = 0
-                        self.trade_log.append(f"{current_date_str}: SOLD {shares_to_sell} {ticker} @ {current_price:.2f}")
-
-            self.portfolio_history.append({'date': date, 'value': portfolio_value})
+        # --- Main simulation loop (compiled) ---
+        value_hist, shares, values, self.cash, trades = _simulate(close, signals, self.cash, BUY_ALLOCATION)
+
+        # Format the dates once instead of boxing a Timestamp for every trade
+        date_labels = sim_dates.strftime('%Y-%m-%d').to_numpy() if len(trades) else []
+        for i, k, num_shares, price in trades.tolist():
+            action = 'BOUGHT' if num_shares > 0 else 'SOLD'
+            self.trade_log.append(f"{date_labels[int(i)]}: {action} {abs(int(num_shares))} {self.tickers[int(k)]} @ {price:.2f}")
+        self.portfolio_history = np.empty(num_dates, dtype=PORTFOLIO_HISTORY_DTYPE)
+        self.portfolio_history['date'] = sim_dates.to_numpy()
+        self.portfolio_history['value'] = value_hist
+        for k, ticker in enumerate(self.tickers):
+            self.portfolio[ticker] = {'shares': int(shares[k]), 'value': float(values[k])}
 
         return self._calculate_performance_metrics()
 
+    def _generate_signal_codes(self, data):
+        """
+        Generates a ticker's signals as an int8 array (1 BUY, -1 SELL, 0 HOLD),
+        using the strategy's array API when it provides one.
+        """
+        if hasattr(self.strategy, 'generate_signals_array'):
+            return self.strategy.generate_signals_array(data)
+        signals = self.strategy.generate_signals(data).reindex(data.index)
+        return signals.map(SIGNAL_CODES).fillna(0).to_numpy(np.int8)
+
     def _calculate_performance_metrics(self):
         """
         Calculates performance metrics after the backtest is complete.
         """
-        if not self.portfolio_history:
+        if len(self.portfolio_history) == 0:
             return {"error": "No trades were made and no portfolio history was recorded."}
 
         report = {}
@@ -105,15 +239,12 @@ class Backtester:
         num_years = num_days / 365.25
         report['Annualized Return (%)'] = ((1 + report['Total Return (%)'] / 100)**(1/num_years) - 1) * 100 if num_years > 0 else 0
 
-        # 3. Maximum Drawdown (MDD)
-        portfolio_df['peak'] = portfolio_df['value'].cummax()
-        portfolio_df['drawdown'] = (portfolio_df['value'] - portfolio_df['peak']) / portfolio_df['peak']
-        report['Max Drawdown (%)'] = portfolio_df['drawdown'].min() * 100
-
-        # 4. Sharpe Ratio (assuming risk-free rate is 0)
-        portfolio_df['daily_return'] = portfolio_df['value'].pct_change()
-        if portfolio_df['daily_return'].std() > 0:
-            sharpe_ratio = (portfolio_df['daily_return'].mean() / portfolio_df['daily_return'].std()) * np.sqrt(252) # 252 trading days
+        # 3. Maximum Drawdown (MDD) and 4. Sharpe Ratio (assuming risk-free rate is 0),
+        # computed together in one compiled pass over the values
+        max_drawdown, mean_return, std_return = _drawdown_and_return_stats(portfolio_df['value'].to_numpy())
+        report['Max Drawdown (%)'] = max_drawdown * 100
+        if std_return > 0:
+            sharpe_ratio = (mean_return / std_return) * np.sqrt(252) # 252 trading days
         else:
             sharpe_ratio = 0.0
         report['Sharpe Ratio'] = sharpe_ratio